@@ -1,13 +1,16 @@
 use eyre::Result;
+use once_cell::sync::Lazy;
 use regex::Regex;
 
 pub fn parse(url: &str) -> Result<url::Url> {
+    static SCHEME_REGEX: Lazy<Regex> =
+        Lazy::new(|| Regex::new("https?|wss?").expect("Unable to create regex"));
+
     // Ensure that url is fully formed
     let url = if url.starts_with(':') {
         format!("http://127.0.0.1{}", url)
     } else {
-        let re = Regex::new("https?|wss?").unwrap();
-        match re.captures(&url) {
+        match SCHEME_REGEX.captures(url) {
             Some(_) => url.to_string(),
             None => format!("http://{}", url),
         }